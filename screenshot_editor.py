@@ -1,12 +1,12 @@
 import Quartz
-import LaunchServices
 import Quartz.CoreGraphics as CG
 import datetime
+import functools
 import sys
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import filedialog, colorchooser
-from PIL import Image, ImageTk, ImageDraw, ImageFilter
+from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageChops
 import traceback
 import io
 
@@ -19,6 +19,12 @@ except ImportError:
     NSImage = None
     NSData = None
 
+# Optional fast path for compositing
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ====================== Updated Style Constants ======================
 DARK_BG = "#0A0A0A"  # Darker background
 DARK_FG = "#F5F5F5"  # Brighter text
@@ -27,6 +33,8 @@ SLIDER_TROUGH = "#303030"
 FONT_NAME = "SF Pro Display"  # Apple's system font
 TOOLTIP_BG = "#252525"
 SHADOW_COLOR = (0, 0, 0, 100)  # Base shadow color with alpha
+SHADOW_OFFSET = (8, 8)  # Shadow displacement at full resolution
+SHADOW_RADIUS = 10  # Shadow blur radius at full resolution
 
 # ====================== Icon Paths ======================
 ICONS = {
@@ -61,7 +69,10 @@ class GlobalHotkeyListener:
         self.eventTap = None
 
     def start(self):
-        event_mask = Quartz.kCGEventMaskForAllEvents
+        # Only subscribe to key-downs: with kCGEventMaskForAllEvents the
+        # callback crossed the PyObjC bridge for every mouse move on the
+        # system just to be filtered out in Python.
+        event_mask = Quartz.CGEventMaskBit(Quartz.kCGEventKeyDown)
         self.eventTap = Quartz.CGEventTapCreate(
             Quartz.kCGSessionEventTap,
             Quartz.kCGHeadInsertEventTap,
@@ -162,8 +173,19 @@ class ShadowControls(ttk.LabelFrame):
             self.slider.slider.get()
         )
 
+@functools.lru_cache(maxsize=None)
+def _load_icon(path):
+    # Decode, resample, and wrap each icon exactly once; the cache keeps the
+    # PhotoImage references alive and shares them across editor windows.
+    try:
+        img = Image.open(path).resize((24, 24))
+        return ImageTk.PhotoImage(img)
+    except Exception as e:
+        print(f"Error loading icon {path}: {e}")
+        return None
+
 # ====================== Image Processing Functions ======================
-def capture_screenshot(filename="temp_screenshot.png"):
+def capture_screenshot():
     display_id = CG.CGMainDisplayID()
     rect = CG.CGDisplayBounds(display_id)
     img = CG.CGWindowListCreateImage(
@@ -172,65 +194,293 @@ def capture_screenshot(filename="temp_screenshot.png"):
         CG.kCGNullWindowID,
         CG.kCGWindowImageDefault
     )
-    dest = Quartz.CGImageDestinationCreateWithURL(
-        Quartz.CFURLCreateWithFileSystemPath(None, filename, Quartz.kCFURLPOSIXPathStyle, False),
-        LaunchServices.kUTTypePNG,
-        1,
-        None
-    )
-    Quartz.CGImageDestinationAddImage(dest, img, None)
-    Quartz.CGImageDestinationFinalize(dest)
-    return filename
+    # Read the CGImage's backing BGRA buffer directly instead of encoding
+    # to PNG on disk and decoding it back -- that roundtrip cost 50-200 ms
+    # per capture on a 4K display.
+    w = CG.CGImageGetWidth(img)
+    h = CG.CGImageGetHeight(img)
+    stride = CG.CGImageGetBytesPerRow(img)
+    data = CG.CGDataProviderCopyData(CG.CGImageGetDataProvider(img))
+    return Image.frombuffer("RGBA", (w, h), data, "raw", "BGRA", stride, 1)
+
+@functools.lru_cache(maxsize=8)
+def _corner_tile(r):
+    # Top-left quarter of an r-radius disk; the other three corners are
+    # just flips of this one.
+    tile = Image.new('L', (2 * r, 2 * r), 0)
+    d = ImageDraw.Draw(tile)
+    d.ellipse([0, 0, 2 * r - 1, 2 * r - 1], fill=255)
+    return tile.crop((0, 0, r, r))
 
-def round_image(pil_image, corner_radius=20):
+@functools.lru_cache(maxsize=8)
+def _rounded_mask(w, h, corner_radius):
+    # Rasterizing the mask is the expensive part of round_image, and slider
+    # drags keep asking for the same (size, radius) combinations, so keep a
+    # small cache of ready-made masks. Only the four r-by-r corner squares
+    # differ from a solid rectangle, so rasterize a single corner tile and
+    # stamp it four times instead of drawing a full rounded rectangle.
+    r = min(corner_radius, w // 2, h // 2)
+    mask = Image.new('L', (w, h), 255)
+    if r > 0:
+        tile = _corner_tile(r)
+        mask.paste(tile, (0, 0))
+        mask.paste(tile.transpose(Image.FLIP_LEFT_RIGHT), (w - r, 0))
+        mask.paste(tile.transpose(Image.FLIP_TOP_BOTTOM), (0, h - r))
+        mask.paste(tile.transpose(Image.ROTATE_180), (w - r, h - r))
+    return mask
+
+def round_image(pil_image, corner_radius=20, inplace=False):
     if corner_radius <= 0:
         return pil_image
     w, h = pil_image.size
-    mask = Image.new('L', (w, h), 0)
-    d = ImageDraw.Draw(mask)
-    d.rounded_rectangle([0, 0, w, h], corner_radius, fill=255)
+    mask = _rounded_mask(w, h, corner_radius)
+    if inplace:
+        # Callers that own pil_image can skip the full RGBA copy: fold the
+        # mask into the existing alpha (preserving any translucency the
+        # image already has) and write it back in place.
+        pil_image.putalpha(ImageChops.multiply(pil_image.getchannel("A"),
+                                               mask))
+        return pil_image
     out = pil_image.copy()
     out.putalpha(mask)
     return out
 
+def _scratch_array(scratch, key, shape, dtype):
+    # Reused per-size buffer from the editor's scratch pool; sizes only
+    # change when the screenshot or padding does, so in steady state every
+    # preview hits the same allocations.
+    if scratch is None:
+        return np.empty(shape, dtype)
+    buf = scratch.get(key)
+    if buf is None or buf.shape != shape:
+        scratch[key] = buf = np.empty(shape, dtype)
+    return buf
+
+# Lazily-created Core Image context, shared across previews. Flips to
+# unavailable on the first failure so we do not retry a broken GPU path
+# on every slider tick.
+_ci_context = None
+_ci_unavailable = False
+
+def _blur_shadow_gpu(shadow, radius):
+    # Route the blur through Core Image so it runs on the GPU; the mask
+    # goes over as a single-channel R8 bitmap and comes back the same way.
+    global _ci_context
+    if _ci_context is None:
+        _ci_context = Quartz.CIContext.contextWithOptions_(None)
+    w, h = shadow.size
+    ci = Quartz.CIImage.imageWithBitmapData_bytesPerRow_size_format_colorSpace_(
+        shadow.tobytes(), w, Quartz.CGSizeMake(w, h), Quartz.kCIFormatR8, None)
+    # CIGaussianBlur samples outside the extent as zero, which would fade
+    # the mask's borders; clamp to replicate edges so this path returns the
+    # same result as the CPU blurs (constant in -> constant out).
+    ci = ci.imageByClampingToExtent()
+    blur = Quartz.CIFilter.filterWithName_("CIGaussianBlur")
+    blur.setValue_forKey_(ci, "inputImage")
+    blur.setValue_forKey_(radius, "inputRadius")
+    out = blur.valueForKey_("outputImage").imageByCroppingToRect_(
+        Quartz.CGRectMake(0, 0, w, h))
+    buf = bytearray(w * h)
+    _ci_context.render_toBitmap_rowBytes_bounds_format_colorSpace_(
+        out, buf, w, Quartz.CGRectMake(0, 0, w, h), Quartz.kCIFormatR8, None)
+    return Image.frombuffer('L', (w, h), bytes(buf), 'raw', 'L', 0, 1)
+
+def _box_blur_axis(arr, r, axis):
+    # Running-sum box filter along one axis: O(N) regardless of radius,
+    # with edge-clamped borders like PIL's blur.
+    n = arr.shape[axis]
+    pad_width = [(0, 0), (0, 0)]
+    pad_width[axis] = (r + 1, r)
+    padded = np.pad(arr, pad_width, mode="edge")
+    c = np.cumsum(padded, axis=axis, dtype=np.float32)
+    hi = [slice(None), slice(None)]
+    lo = [slice(None), slice(None)]
+    hi[axis] = slice(2 * r + 1, 2 * r + 1 + n)
+    lo[axis] = slice(0, n)
+    return (c[tuple(hi)] - c[tuple(lo)]) / (2 * r + 1)
+
+def _blur_shadow_cpu(shadow, radius):
+    # Separable approximation: two box passes per axis converge on a
+    # Gaussian (box width chosen so the combined variance matches sigma =
+    # radius), and the running-sum form makes the cost radius-independent.
+    arr = np.asarray(shadow, dtype=np.float32)
+    r = max(1, round(radius * 1.22))
+    for _ in range(2):
+        arr = _box_blur_axis(arr, r, 0)
+        arr = _box_blur_axis(arr, r, 1)
+    return Image.fromarray(arr.astype(np.uint8), "L")
+
+def _blur_shadow(shadow, radius=SHADOW_RADIUS):
+    global _ci_unavailable
+    if not _ci_unavailable:
+        try:
+            return _blur_shadow_gpu(shadow, radius)
+        except Exception:
+            _ci_unavailable = True
+    if np is not None:
+        return _blur_shadow_cpu(shadow, radius)
+    # Last resort: the shadow is low-frequency, so blur a 4x-reduced copy
+    # with a proportionally smaller radius and scale it back up -- visually
+    # identical to a full-resolution blur at ~1/16 the cost.
+    return (shadow.reduce(4)
+            .filter(ImageFilter.GaussianBlur(radius=radius / 4))
+            .resize(shadow.size, Image.BILINEAR))
+
+def _premul_fg(fg_image, scratch):
+    # Premultiply the foreground's RGB by its alpha once and keep it (plus
+    # the inverse-alpha factor) in the scratch pool; the rounded foreground
+    # only changes on radius edits, so padding/background/shadow previews
+    # reuse the premultiplied layer as-is. _render_pipeline drops the entry
+    # whenever it re-rounds, so a stale id can never be served.
+    key = id(fg_image)
+    if scratch is not None:
+        cached = scratch.get("fg_premul")
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+    fg = np.asarray(fg_image, dtype=np.uint16)
+    inv = 255 - fg[..., 3:]
+    np.multiply(fg[..., :3], fg[..., 3:], out=fg[..., :3])
+    if scratch is not None:
+        scratch["fg_premul"] = (key, fg, inv)
+    return fg, inv
+
+@functools.lru_cache(maxsize=4)
+def _make_compositor(out_w, out_h, fg_w, fg_h, padding, shadow_offset):
+    # Specialize the fused compositor for one geometry: clip bounds and
+    # slices are resolved here once, so the per-frame call is nothing but
+    # pixel work. Geometry only changes on screenshot or padding edits, so
+    # slider drags keep hitting the same cached closure.
+    ox = padding + shadow_offset[0]
+    oy = padding + shadow_offset[1]
+    sh = min(fg_h, out_h - oy)
+    sw = min(fg_w, out_w - ox)
+    shadow_box = (slice(oy, oy + sh), slice(ox, ox + sw))
+    fg_box = (slice(padding, padding + fg_h), slice(padding, padding + fg_w))
+
+    def compositor(out, shadow_mask, fg_image, scratch):
+        # Fused Porter-Duff "over" for shadow and foreground in one pass
+        # over a single output array -- replaces the shadow-canvas
+        # allocation, the full-canvas alpha_composite, and the foreground
+        # paste. Integer math in uint16 temporaries; (x + 127) // 255 is
+        # the usual rounding divide, and every product stays within uint16
+        # because src*a + dst*(255-a) <= 255^2.
+        sm = np.asarray(shadow_mask, dtype=np.uint16)[:sh, :sw]
+        region = _scratch_array(scratch, "shadow16", (sh, sw, 4), np.uint16)
+        np.copyto(region, out[shadow_box])
+        inv = 255 - sm
+        rgb = region[..., :3]
+        np.multiply(rgb, inv[..., None], out=rgb)
+        rgb += 127
+        rgb //= 255
+        alpha = region[..., 3]
+        np.multiply(alpha, inv, out=alpha)
+        alpha += 127
+        alpha //= 255
+        alpha += sm
+        out[shadow_box] = region
+
+        fg, inv = _premul_fg(fg_image, scratch)
+        region = _scratch_array(scratch, "dst16", (fg_h, fg_w, 4), np.uint16)
+        np.copyto(region, out[fg_box])
+        np.multiply(region, inv, out=region)
+        region[..., :3] += fg[..., :3]
+        region += 127
+        region //= 255
+        region[..., 3:] += fg[..., 3:]
+        out[fg_box] = region
+
+        return Image.fromarray(out, "RGBA")
+
+    return compositor
+
+def _composite_numpy(out, shadow_mask, fg_image, padding, shadow_offset,
+                     scratch=None):
+    fg_w, fg_h = fg_image.size
+    compositor = _make_compositor(out.shape[1], out.shape[0], fg_w, fg_h,
+                                  padding, tuple(shadow_offset))
+    return compositor(out, shadow_mask, fg_image, scratch)
+
 def add_background(fg_image, bg_mode="color", color=(255, 255, 255, 255),
                    bg_image=None, padding=20, shadow_enabled=True,
-                   shadow_opacity=30, shadow_offset=(8, 8)):
-    # Create shadow if enabled
-    shadow_layer = None
-    if shadow_enabled:
-        shadow = Image.new("RGBA", fg_image.size, (0, 0, 0, shadow_opacity))
-        shadow_blur = shadow.filter(ImageFilter.GaussianBlur(radius=10))
-        
-        # Create shadow canvas
-        shadow_w = fg_image.width + 2 * padding + shadow_offset[0]
-        shadow_h = fg_image.height + 2 * padding + shadow_offset[1]
-        shadow_canvas = Image.new("RGBA", (shadow_w, shadow_h), (0, 0, 0, 0))
-        shadow_canvas.paste(shadow_blur, (padding + shadow_offset[0], 
-                                        padding + shadow_offset[1]))
-    
-    # Create background canvas
+                   shadow_opacity=30, shadow_offset=SHADOW_OFFSET,
+                   shadow_radius=SHADOW_RADIUS, bg_cache=None, scratch=None):
     w_fg, h_fg = fg_image.size
     new_w = w_fg + 2 * padding
     new_h = h_fg + 2 * padding
-    
+
+    # Resolve the background source. The LANCZOS resample is the single
+    # biggest cost when a background image is set; cache the resized result
+    # pristine so padding drags only pay for a blit.
+    bg_source = None
     if bg_mode == "image" and bg_image:
-        back = bg_image.resize((new_w, new_h), Image.LANCZOS).convert("RGBA")
+        if bg_cache is not None:
+            # The cache value pins the source image, so its id cannot be
+            # recycled by a new background while the entry lives; the
+            # identity check guards the hit regardless.
+            bg_key = (id(bg_image), new_w, new_h)
+            cached = bg_cache.get(bg_key)
+            if cached is not None and cached[0] is bg_image:
+                bg_source = cached[1]
+            else:
+                if len(bg_cache) >= 8:
+                    bg_cache.clear()
+                bg_source = bg_image.resize((new_w, new_h),
+                                            Image.LANCZOS).convert("RGBA")
+                bg_cache[bg_key] = (bg_image, bg_source)
+        else:
+            bg_source = bg_image.resize((new_w, new_h),
+                                        Image.LANCZOS).convert("RGBA")
+
+    # The fused compositor blends in premultiplied form and hands the
+    # buffer back as straight RGBA, which is only exact while the
+    # destination is fully opaque; translucent backgrounds take the PIL
+    # path below instead.
+    if bg_source is not None:
+        bg_opaque = ("A" not in bg_image.getbands()
+                     and "transparency" not in bg_image.info)
+    else:
+        bg_opaque = len(color) < 4 or color[3] == 255
+
+    if shadow_enabled:
+        # The shadow is just black at varying alpha, so keep it as a
+        # single-channel mask: the blur then touches 1 byte/pixel, not 4.
+        shadow = Image.new("L", fg_image.size, shadow_opacity)
+        shadow_blur = _blur_shadow(shadow, shadow_radius)
+        if np is not None and bg_opaque:
+            # Write the background straight into the output canvas -- one
+            # pass instead of an Image.new/copy pair -- then run the fused
+            # compositor against the reusable scratch buffers.
+            out = np.empty((new_h, new_w, 4), np.uint8)
+            if bg_source is not None:
+                np.copyto(out, np.asarray(bg_source))
+            else:
+                out[:] = color
+            return _composite_numpy(out, shadow_blur, fg_image, padding,
+                                    shadow_offset, scratch)
+
+    if bg_source is not None:
+        back = bg_source.copy()
     else:
         back = Image.new("RGBA", (new_w, new_h), color)
-    
-    # Composite elements
+
+    # Blend the shadow straight onto the background, then paste the
+    # foreground over it -- one full-canvas blend instead of two.
     if shadow_enabled:
-        back = Image.alpha_composite(
-            Image.alpha_composite(back, shadow_canvas), 
-            add_background(fg_image, "color", (0, 0, 0, 0), padding=padding)
-        )
-    
+        shadow_canvas = Image.new("RGBA", (new_w, new_h), (0, 0, 0, 0))
+        shadow_canvas.paste((0, 0, 0, 255), (padding + shadow_offset[0],
+                                        padding + shadow_offset[1]),
+                            shadow_blur)
+        back.alpha_composite(shadow_canvas, (0, 0))
+
     back.paste(fg_image, (padding, padding), fg_image)
     return back
 
 # ====================== Screenshot Editor ======================
 class ScreenshotEditor:
+    # Class-level so slider callbacks fired while widgets are still being
+    # built (before _setup_state runs) see a valid value.
+    _preview_after_id = None
+
     def __init__(self, root):
         self.root = root
         self.root.title("ShutterPy Pro")
@@ -280,14 +530,7 @@ class ScreenshotEditor:
         controls = ttk.Frame(self.root, padding=10)
         controls.grid(row=0, column=1, sticky="ns", padx=(0, 20), pady=20)
         
-        self.icons = {}
-        for name, path in ICONS.items():
-            try:
-                img = Image.open(path).resize((24, 24))
-                self.icons[name] = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"Error loading icon {path}: {e}")
-                self.icons[name] = None
+        self.icons = {name: _load_icon(path) for name, path in ICONS.items()}
 
         # UI Elements
         self.capture_btn = ttk.Button(controls, image=self.icons['camera'],
@@ -370,6 +613,13 @@ class ScreenshotEditor:
         self.image_draw_offset = (0, 0)
         self.shadow_enabled = True
         self.shadow_opacity = 30
+        self._rounded_cache = None
+        self._bg_resize_cache = {}
+        self._scratch = {}
+        self._preview_src = None
+        self._preview_scale = 1
+        self._canvas_flush_id = None
+        self._canvas_img_id = None
         
         self.radius_slider.set(self.corner_radius)
         self.padding_slider.set(self.padding)
@@ -386,25 +636,175 @@ class ScreenshotEditor:
         if self.original_image:
             self.push_undo()
             self.redo_stack.clear()
-        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        fname = f"screenshot_{ts}.png"
-        capture_screenshot(fname)
-        self.original_image = Image.open(fname).convert("RGBA")
+        self.original_image = capture_screenshot()
+        self._rounded_cache = None
+        self._preview_src = None
         self.apply_effects()
 
     def apply_effects(self):
         if not self.original_image:
             return
-        sc_rounded = round_image(self.original_image, self.corner_radius)
+        # Interactive previews run on a canvas-sized reduction of the
+        # screenshot; compositing cost scales with pixel count, so there is
+        # no point blurring and blending Retina pixels the display cannot
+        # show. The full-resolution pipeline only runs on save/copy.
+        src = self._preview_source()
+        self.final_image = self._render_pipeline(src, self._preview_scale)
+        self.show_in_canvas()
+
+    def _preview_source(self):
+        if self._preview_src is not None:
+            return self._preview_src
+        cw = self.canvas.winfo_width()
+        ch = self.canvas.winfo_height()
+        iw, ih = self.original_image.size
+        if cw > 1 and ch > 1:
+            k = max(1, min(iw // cw, ih // ch))
+        else:
+            k = 1  # canvas not laid out yet
+        self._preview_scale = k
+        self._preview_src = (self.original_image.reduce(k) if k > 1
+                             else self.original_image)
+        return self._preview_src
+
+    def _render_pipeline(self, src, scale=1):
+        # All geometry -- radius, padding, and the shadow's offset and
+        # softness -- is expressed in full-resolution pixels and divided by
+        # the preview scale here, so the preview shows the same shadow the
+        # saved image gets.
+        corner_radius = self.corner_radius // scale
+        padding = self.padding // scale
+        # Padding/background/shadow edits leave the rounded screenshot
+        # untouched, so reuse the last one instead of re-copying a multi-MB
+        # image on every slider tick.
+        key = (id(src), corner_radius)
+        if self._rounded_cache and self._rounded_cache[0] == key:
+            sc_rounded = self._rounded_cache[1]
+        else:
+            sc_rounded = round_image(src, corner_radius)
+            self._rounded_cache = (key, sc_rounded)
+            # The premultiplied copy in the scratch pool belongs to the old
+            # rounded image; a recycled id must not resurrect it.
+            self._scratch.pop("fg_premul", None)
         with_bg = add_background(
-            sc_rounded, 
-            self.bg_mode, 
-            self.bg_color, 
-            self.bg_image, 
-            self.padding,
+            sc_rounded,
+            self.bg_mode,
+            self.bg_color,
+            self.bg_image,
+            padding,
             shadow_enabled=self.shadow_enabled,
-            shadow_opacity=self.shadow_opacity
+            shadow_opacity=self.shadow_opacity,
+            shadow_offset=(SHADOW_OFFSET[0] // scale,
+                           SHADOW_OFFSET[1] // scale),
+            shadow_radius=SHADOW_RADIUS / scale,
+            bg_cache=self._bg_resize_cache,
+            scratch=self._scratch
         )
-        final = round_image(with_bg, self.corner_radius)
-        self.final_image = final
-        self.show_in
\ No newline at end of file
+        # with_bg is ours alone, so round it in place rather than copying
+        # the whole canvas again. With an opaque background the canvas
+        # alpha is uniform 255, so the cached outer mask can be written
+        # directly and the ImageChops.multiply folded away.
+        if corner_radius <= 0:
+            return with_bg
+        if self.bg_mode == "image" or self.bg_color[3] == 255:
+            with_bg.putalpha(_rounded_mask(with_bg.width, with_bg.height,
+                                           corner_radius))
+            return with_bg
+        return round_image(with_bg, corner_radius, inplace=True)
+
+    def _render_full(self):
+        if not self.original_image:
+            return None
+        if self._preview_scale == 1:
+            return self.final_image
+        return self._render_pipeline(self.original_image)
+
+    def show_in_canvas(self):
+        # Mark the canvas dirty and flush once per idle cycle: a burst of
+        # preview updates then costs a single PhotoImage instead of one per
+        # update.
+        if self._canvas_flush_id is None:
+            self._canvas_flush_id = self.root.after_idle(self._flush_to_canvas)
+
+    def _flush_to_canvas(self):
+        self._canvas_flush_id = None
+        if not self.final_image:
+            return
+        cw = self.canvas.winfo_width() or 1
+        ch = self.canvas.winfo_height() or 1
+        iw, ih = self.final_image.size
+        scale = min(cw / iw, ch / ih, 1.0)
+        disp_w = max(1, int(iw * scale))
+        disp_h = max(1, int(ih * scale))
+        self.canvas_scale_ratio = scale
+        disp = self.final_image.resize((disp_w, disp_h), Image.LANCZOS)
+        # Keep exactly one PhotoImage reference (dropping it mid-redraw
+        # makes Tk flicker) and reconfigure one persistent canvas item
+        # instead of deleting and recreating it.
+        self.tk_image = ImageTk.PhotoImage(disp)
+        x = (cw - disp_w) // 2
+        y = (ch - disp_h) // 2
+        self.image_draw_offset = (x, y)
+        if self._canvas_img_id is None:
+            self._canvas_img_id = self.canvas.create_image(
+                x, y, anchor="nw", image=self.tk_image)
+        else:
+            self.canvas.itemconfig(self._canvas_img_id, image=self.tk_image)
+            self.canvas.coords(self._canvas_img_id, x, y)
+
+    # ---------------- Slider callbacks (debounced) ----------------
+    def on_radius_changed(self, value):
+        self.corner_radius = value
+        self._schedule_preview()
+
+    def on_padding_changed(self, value):
+        self.padding = value
+        self._schedule_preview()
+
+    def on_shadow_changed(self, enabled, opacity):
+        self.shadow_enabled = enabled
+        self.shadow_opacity = int(opacity)
+        self._schedule_preview()
+
+    def _schedule_preview(self):
+        # A fast drag fires dozens of slider events per second; coalesce
+        # them so apply_effects runs once per settled frame, not per event.
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(30, self._flush_preview)
+
+    def _flush_preview(self):
+        self._preview_after_id = None
+        self.apply_effects()
+
+    def save_image(self):
+        image = self._render_full()
+        if image is None:
+            return
+        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            initialfile=f"screenshot_{ts}.png",
+            filetypes=[("PNG Image", "*.png")])
+        if path:
+            image.save(path)
+
+    def copy_final_to_clipboard(self):
+        if NSPasteboard is None:
+            return
+        image = self._render_full()
+        if image is None:
+            return
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")
+        png_bytes = buf.getvalue()
+        # Hand the pasteboard a pointer to our buffer instead of letting
+        # NSData duplicate it -- a 20 MB+ copy saved on large screenshots.
+        # The Python reference must outlive the pasteboard item, so keep it
+        # on self; freeWhenDone=False leaves ownership with us.
+        self._clipboard_buf = png_bytes
+        data = NSData.dataWithBytesNoCopy_length_freeWhenDone_(
+            png_bytes, len(png_bytes), False)
+        pb = NSPasteboard.generalPasteboard()
+        pb.clearContents()
+        pb.setData_forType_(data, "public.png")
\ No newline at end of file